@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
+import multiprocessing
 import os
-from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 from zoneinfo import ZoneInfo
 
 import requests
+from requests.adapters import HTTPAdapter
 import re
 from src import alert, edgar, filters, parse, price
 
 DATA_DIR = Path("data")
 RESULTS_JSON = DATA_DIR / "results.json"
 RESULTS_CSV = DATA_DIR / "results.csv"
-CACHE_FILINGS = DATA_DIR / "cache_filings.json"
-SEEN_ACCESSIONS = DATA_DIR / "seen_accessions.json"
+CACHE_FILINGS = DATA_DIR / "cache_filings.sqlite3"
+SEEN_ACCESSIONS = DATA_DIR / "seen_accessions.jsonl"
 TICKER_MAP_PATH = DATA_DIR / "ticker_map.json"
 PRICE_CACHE_PATH = Path("price_cache.json")
 REJECTIONS_JSON = DATA_DIR / "rejections.json"
@@ -21,29 +25,98 @@ REJECTIONS_CSV = DATA_DIR / "rejections.csv"
 
 WINDOW_HOURS = 84
 
+NY_TZ = ZoneInfo("America/New_York")
+
 USER_AGENT = edgar.USER_AGENT
 
 FORCE_REPROCESS = 1
 
+FORMS_OF_INTEREST_SET = frozenset(edgar.FORMS_OF_INTEREST)
+
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", os.cpu_count() or 1))
+# Parse workers start while the download threads hold locks (rate limiter, sqlite,
+# urllib3 pools); forking then could copy a held lock into the child.
+_PARSE_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
 LIMIT_PER_CIK = 8
 
 def today_et():
-    return datetime.now(ZoneInfo("America/New_York")).date()
+    return datetime.now(NY_TZ).date()
 
 
-def derive_common_ticker_from_map(ticker_map: str) -> str | None:
+# Same suffixes filters.is_non_common_security flags; "WS" must win over "W".
+_NON_COMMON_SUFFIXES_LONGEST_FIRST = tuple(sorted(filters.NON_COMMON_SUFFIXES, key=len, reverse=True))
+
+
+def derive_common_ticker_from_map(ticker_map: str, known_tickers: Iterable[str] = ()) -> str | None:
     """
     If SEC's single-ticker mapping points to a non-common instrument (often warrants),
     try a simple transformation to the common ticker.
 
-    Example: BENFW -> BENF
+    Stripping WS/WT/RT is only trusted when the base is among known_tickers (the
+    issuer's own listed symbols): VRT, CART or FLWS are common stock, and their
+    stems are other companies' tickers. Otherwise only a trailing "W" is dropped.
+
+    Example: BENFW -> BENF, ABCWS -> ABC (if ABC is known for the same CIK)
     """
     t = (ticker_map or "").upper().strip()
+    known = {k.upper().strip() for k in known_tickers}
+    for suffix in _NON_COMMON_SUFFIXES_LONGEST_FIRST:
+        if len(t) > len(suffix) and t.endswith(suffix) and t[:-len(suffix)] in known:
+            return t[:-len(suffix)]
     if t.endswith("W") and len(t) >= 2:
         return t[:-1]
     return None
 
 
+def _event_key(r: dict) -> tuple:
+    return (r.get("ticker"), r.get("ratio_new"), r.get("ratio_old"), r.get("rounding_policy"))
+
+
+_NO_FILED_AT = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _filed_at_key(raw: str | None) -> datetime:
+    # Compare instants, not ISO strings: "…-05:00" vs "…Z" spellings sort wrong lexicographically.
+    try:
+        dt = datetime.fromisoformat(raw)
+    except (TypeError, ValueError):
+        return _NO_FILED_AT
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=NY_TZ)
+
+
+def _event_rank(r: dict) -> tuple:
+    # Prefer a record that has an effective_date, then the latest filed_at
+    return (bool(r.get("effective_date")), _filed_at_key(r.get("filed_at")))
+
+
+def dedupe_events(records: list[dict]) -> list[dict]:
+    # Winner's rank is stored alongside it so each record is ranked exactly once.
+    best = {}
+    for r in records:
+        k = _event_key(r)
+        rk = _event_rank(r)
+        cur = best.get(k)
+        if cur is None or rk > cur[0]:
+            best[k] = (rk, r)
+    return [r for _, r in best.values()]
+
+
+@dataclass(slots=True)
+class Counts:
+    total: int = 0
+    wrong_form: int = 0
+    skipped_seen: int = 0
+    no_text: int = 0
+    no_reverse_lang: int = 0
+    reverse_lang: int = 0
+    rejected_by_policy: int = 0
+    accepted: int = 0
+    missing_effective_date: int = 0
+
+
 class Runner:
     def __init__(self):
         if not USER_AGENT or "@" not in USER_AGENT:
@@ -53,6 +126,10 @@ class Runner:
 
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": USER_AGENT})
+        # Default pool keeps 10 connections per host; size it for the concurrent
+        # filing/feed/price workers so connections are reused, not discarded.
+        # Retries stay in edgar._get_with_retries, behind the shared rate limiter.
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
 
         self.filing_cache = edgar.FilingCache(CACHE_FILINGS)
         self.seen = edgar.SeenAccessions(SEEN_ACCESSIONS)
@@ -62,6 +139,13 @@ class Runner:
         self.price_cache = price.PriceCache(PRICE_CACHE_PATH)
 
     def run(self) -> List[dict]:
+        try:
+            return self._run()
+        finally:
+            # Checkpoint the SQLite WAL even on failure so no cached row is left in -wal
+            self.filing_cache.close()
+
+    def _run(self) -> List[dict]:
         # Option B: universe scan via submissions JSON (no daily index)
         filings = edgar.fetch_recent_filings_via_submissions_universe(
             edgar.FORMS_OF_INTEREST,
@@ -77,24 +161,13 @@ class Runner:
 
         print(f"Fetched {len(filings)} filings (submissions universe batch)")
 
-        counts = {
-            "total": 0,
-            "skipped_seen": 0,
-            "no_text": 0,
-            "no_reverse_lang": 0,
-            "reverse_lang": 0,
-            "rejected_by_policy": 0,
-            "accepted": 0,
-            "missing_effective_date": 0,
-        }
+        counts = Counts()
 
         results: List[dict] = []
         rejections: List[dict] = []
 
         def reject(filing, stage: str, reason: str, extra: dict | None = None):
-            acc_no_dashes = filing.accession.replace("-", "")
-            default_url = f"https://www.sec.gov/Archives/edgar/data/{int(filing.cik)}/{acc_no_dashes}/{filing.accession}-index.html"
-            filing_url = getattr(filing, "url", None) or getattr(filing, "link", None) or default_url
+            filing_url = filing.link or filing.index_url
 
             # IMPORTANT: keep a stable set of fields across ALL rejection records
             rec = {
@@ -102,7 +175,7 @@ class Runner:
                 "company": filing.company,
                 "cik": filing.cik,
                 "form": filing.form,
-                "filed_at": filing.filed_at.isoformat() if getattr(filing, "filed_at", None) else None,
+                "filed_at": filing.filed_at.isoformat() if filing.filed_at else None,
                 "filing_url": filing_url,
                 "stage": stage,
                 "reason": reason,
@@ -125,107 +198,87 @@ class Runner:
 
             rejections.append(rec)
 
+        # One clock reading for the whole batch keeps the age cutoffs consistent across filings.
+        now_et = datetime.now(NY_TZ)
+        today = now_et.date()
+
+        # Cheap metadata gates first, so only surviving filings are downloaded.
+        to_process = []
         for filing in filings:
-            counts["total"] += 1
+            counts.total += 1
+
+            if filing.form not in FORMS_OF_INTEREST_SET:
+                counts.wrong_form += 1
+                reject(filing, "form", f"Form {filing.form} not of interest")
+                continue
 
-            now_et = datetime.now(ZoneInfo("America/New_York"))
+            # Aware datetimes subtract correctly across zones, so the ET conversion
+            # is deferred to the filings that survive the gates.
             filing_time = filing.filed_at
             if filing_time.tzinfo is None:
-                filing_time = filing_time.replace(tzinfo=ZoneInfo("America/New_York"))
-            else:
-                filing_time = filing_time.astimezone(ZoneInfo("America/New_York"))
+                filing_time = filing_time.replace(tzinfo=NY_TZ)
             age_hours = (now_et - filing_time).total_seconds() / 3600
 
             if age_hours > WINDOW_HOURS:
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(filing, "age", f"Old filing: {age_hours:.1f}h > {WINDOW_HOURS}h", {"event_age_hours": round(age_hours, 2)})
                 continue
 
             if not FORCE_REPROCESS and filing.accession in self.seen:
-                counts["skipped_seen"] += 1
+                counts.skipped_seen += 1
                 reject(filing, "seen", "Already processed (seen accession)")
                 continue
 
-            text = edgar.fetch_filing_text(
-                filing, self.filing_cache, self.session, USER_AGENT
-            )
-            if not text:
-                counts["no_text"] += 1
+            to_process.append((filing, filing_time.astimezone(NY_TZ)))
+
+        texts, screens = self._fetch_and_screen(
+            to_process, event_cutoff=now_et - timedelta(hours=WINDOW_HOURS), today=today
+        )
+
+        for (filing, filing_time), screen in zip(to_process, screens):
+            if screen is None:
+                counts.no_text += 1
                 reject(filing, "no_text", "No filing text returned")
                 continue
+            text = texts[filing.accession]
 
-            if parse.is_delisting_notice_only(text):
-                counts["rejected_by_policy"] += 1
+            if screen.delisting_only:
+                counts.rejected_by_policy += 1
                 continue
             # 1) Reverse-split trigger
-            has_reverse = parse.contains_reverse_split_language(text)
-            if not has_reverse:
-                counts["no_reverse_lang"] += 1
+            if not screen.has_reverse:
+                counts.no_reverse_lang += 1
                 reject(filing, "reverse_lang", "No reverse split language detected")
                 continue
 
             # 2) NEW: Require a fresh event date (Period of Report / earliest event reported)
-            event_dt = parse.extract_event_reported_datetime(text)
+            event_dt = screen.event_dt
 
             if event_dt is None:
                 # STRICT: if it fired "reverse split language" but we can't locate an event date,
                 # we do NOT allow it through (prevents stale/boilerplate false positives).
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(filing, "event_dt", "Reverse language present but no event date parsed")
                 continue
 
             event_age_hours = (now_et - event_dt).total_seconds() / 3600
             if event_age_hours > WINDOW_HOURS:
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(filing, "event_dt", f"Stale event_dt: {event_age_hours:.1f}h > {WINDOW_HOURS}h",
                 {"event_dt": event_dt.isoformat(), "event_age_hours": round(event_age_hours, 2)})
                 continue
 
-            counts["reverse_lang"] += 1
+            counts.reverse_lang += 1
 
 
             if not FORCE_REPROCESS:
                 self.seen.add(filing.accession)
 
-            extraction = parse.extract_details(text, filed_at=filing.filed_at)
-            
-
-            meta = self.tickers.lookup(filing.cik)
-            ticker_map = (meta.get("ticker") or "").upper().strip()
-            exchange_map = (meta.get("exchange") or "").upper().strip()
-            exchange = exchange_map  # working var
-            title = meta.get("title", filing.company)
-
-            ticker = ticker_map
-
-            tkr2, exch2 = parse.extract_common_ticker_exchange(text)
-            if tkr2:
-                ticker = tkr2
-                # FIX: normalize exchange even if exch2 is missing
-                exchange = (exch2 or exchange_map).upper().strip()
-            else:
-                tmp_info = filters.SecurityInfo(ticker=ticker_map, exchange=exchange_map, title=title)
-                if filters.is_non_common_security(tmp_info):
-                    derived = derive_common_ticker_from_map(ticker_map)
-                    if derived:
-                        ticker = derived
-                        exchange = exchange_map
-
-            sec_info = filters.SecurityInfo(ticker=ticker, exchange=exchange, title=title)
-
-            rejection = filters.summarize_rejection(
-                text=text,
-                meta=sec_info,
-                policy=extraction.rounding_policy,
-                price=None,
-                ratio_new=extraction.ratio_new,
-                ratio_old=extraction.ratio_old,
-            )
+            extraction = screen.extraction
 
-            today = datetime.now(ZoneInfo("America/New_York")).date()
             # --- Effective date must exist ---
             if extraction.effective_date is None:
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(
                     filing,
                     stage="effective_date",
@@ -240,7 +293,7 @@ class Runner:
 
             # --- Effective date must not be in the past ---
             if extraction.effective_date.date() < today:
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(
                     filing,
                     stage="effective_date",
@@ -256,7 +309,7 @@ class Runner:
 
             # --- Reject explicit ROUND_DOWN policies ---
             if extraction.rounding_policy == parse.ROUND_DOWN:
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(
                     filing,
                     stage="rounding_policy",
@@ -270,10 +323,43 @@ class Runner:
                 continue
 
 
-            # Build an SEC filing index URL (works even if the Filing object doesn't store a URL)
-            acc_no_dashes = filing.accession.replace("-", "")
-            default_url = f"https://www.sec.gov/Archives/edgar/data/{int(filing.cik)}/{acc_no_dashes}/{filing.accession}-index.html"
-            filing_url = getattr(filing, "url", None) or getattr(filing, "link", None) or default_url
+            # Ticker resolution and security-type filters scan the filing text, so they
+            # run only after the cheap date/rounding gates have had a chance to reject
+            # (screen_filing applies the same gates before its ticker scan).
+            meta = self.tickers.lookup(filing.cik)
+            ticker_map = meta.get("ticker", "")
+            exchange_map = meta.get("exchange", "")
+            exchange = exchange_map  # working var
+            title = meta.get("title", filing.company)
+
+            ticker = ticker_map
+
+            tkr2, exch2 = screen.ticker, screen.exchange
+            if tkr2:
+                ticker = tkr2
+                # Both sides arrive normalized (parse upper-cases, TickerMap.lookup canonicalizes)
+                exchange = exch2 or exchange_map
+            else:
+                tmp_info = filters.SecurityInfo(ticker=ticker_map, exchange=exchange_map, title=title)
+                if filters.is_non_common_security(tmp_info):
+                    derived = derive_common_ticker_from_map(ticker_map, self._known_tickers(filing))
+                    if derived:
+                        ticker = derived
+                        exchange = exchange_map
+
+            sec_info = filters.SecurityInfo(ticker=ticker, exchange=exchange, title=title)
+
+            rejection = filters.summarize_rejection(
+                text=text,
+                meta=sec_info,
+                policy=extraction.rounding_policy,
+                price=None,
+                ratio_new=extraction.ratio_new,
+                ratio_old=extraction.ratio_old,
+            )
+
+            # Fall back to the SEC filing index URL (works even if the Filing object doesn't store a URL)
+            filing_url = filing.link or filing.index_url
 
             record = {
                 "accession": filing.accession,
@@ -298,9 +384,9 @@ class Runner:
 
             if rejection is None:
                 results.append(record)
-                counts["accepted"] += 1
+                counts.accepted += 1
             else:
-                counts["rejected_by_policy"] += 1
+                counts.rejected_by_policy += 1
                 reject(filing, "filters", rejection, {
                     "ticker": ticker,
                     "exchange": exchange,
@@ -313,41 +399,8 @@ class Runner:
         self.filing_cache.save()
         self.seen.save()
 
-        self._enrich_with_stooq(results)
-
-        def dedupe_events(records: list[dict]) -> list[dict]:
-            best = {}
-
-            for r in records:
-                key = (
-                    r.get("ticker"),
-                    r.get("ratio_new"),
-                    r.get("ratio_old"),
-                    r.get("rounding_policy"),
-                )
-
-                cur = best.get(key)
-                if cur is None:
-                    best[key] = r
-                    continue
-
-                # Prefer a record that has an effective_date
-                r_eff = r.get("effective_date")
-                c_eff = cur.get("effective_date")
-                if (not c_eff) and r_eff:
-                    best[key] = r
-                    continue
-                if c_eff and (not r_eff):
-                    continue
-
-                # Otherwise keep latest filed_at
-                if (r.get("filed_at") or "") > (cur.get("filed_at") or ""):
-                    best[key] = r
-
-            return list(best.values())
-
-
         results = dedupe_events(results)
+        self._enrich_with_stooq(results)
 
         alert.write_json(RESULTS_JSON, results)
         alert.write_csv(RESULTS_CSV, results)
@@ -357,20 +410,70 @@ class Runner:
         print(f"Wrote {len(rejections)} rejections to {REJECTIONS_JSON} and {REJECTIONS_CSV}")
 
 
-        print("Filter stats:", counts)
+        print("Filter stats:", asdict(counts))
         return results
 
+    def _known_tickers(self, filing) -> List[str]:
+        """Tickers listed for the filer: the map's, plus any its submissions JSON reported."""
+        return self.tickers.tickers_for(filing.cik) + list(filing.tickers)
+
+    def _fetch_and_screen(self, to_process, event_cutoff: datetime, today: date):
+        """
+        Download every filing in to_process and run parse.screen_filing on it.
+        Returns ({accession: text or None}, screens in to_process order).
+
+        Each text is handed to the parser as soon as its download completes, so
+        the CPU-bound regex passes overlap the rate-limited SEC fetches instead
+        of waiting for the slowest one. With more than one filing the parsing
+        is spread over PARSE_WORKERS processes; classify() runs inline first,
+        so only candidate bodies are pickled over to a worker.
+        """
+        filings = [filing for filing, _ in to_process]
+        fetched = edgar.iter_filing_texts(filings, self.filing_cache, self.session, USER_AGENT)
+        texts = {}
+        screens = {}
+
+        if PARSE_WORKERS <= 1 or len(filings) < 2:
+            for filing, text in fetched:
+                texts[filing.accession] = text
+                screens[filing.accession] = parse.screen_filing(text, filing.filed_at, event_cutoff, today)
+            return texts, [screens[filing.accession] for filing in filings]
+
+        with ProcessPoolExecutor(
+            max_workers=min(PARSE_WORKERS, len(filings)), mp_context=_PARSE_MP_CONTEXT
+        ) as ex:
+            for filing, text in fetched:
+                texts[filing.accession] = text
+                verdict = parse.classify(text) if text else None
+                if verdict == parse.CANDIDATE:
+                    screens[filing.accession] = ex.submit(
+                        parse.screen_candidate, text, filing.filed_at, event_cutoff, today
+                    )
+                elif verdict is not None:
+                    screens[filing.accession] = parse.FilingScreen(
+                        delisting_only=verdict == parse.DELISTING_ONLY, has_reverse=False
+                    )
+                else:
+                    screens[filing.accession] = None
+            return texts, [
+                s.result() if isinstance(s, Future) else s
+                for s in (screens[filing.accession] for filing in filings)
+            ]
+
     def _enrich_with_stooq(self, results: List[dict]) -> None:
         """Fetch prices for accepted results and compute potential profit."""
         if not results:
             return
 
+        prices = price.fetch_prices_with_fallback(
+            (record.get("ticker") for record in results), self.price_cache, self.session
+        )
+
         for record in results:
-            ticker = record.get("ticker")
             ratio_new = record.get("ratio_new")
             ratio_old = record.get("ratio_old")
 
-            px = price.fetch_price_with_fallback(ticker, self.price_cache, self.session)
+            px = prices.get(record.get("ticker"))
             record["price"] = px
 
             potential = None
@@ -382,7 +485,7 @@ class Runner:
         self._print_profit_estimates(results)
 
     def _print_profit_estimates(self, results: List[dict]) -> None:
-        print("\nStooq potential profit estimates:")
+        lines = ["\nStooq potential profit estimates:"]
         for record in results:
             ticker = record.get("ticker")
             profit = record.get("potential_profit")
@@ -399,13 +502,16 @@ class Runner:
 
             if missing_fields:
                 missing_display = "/".join(missing_fields)
-                print(f" - {ticker}: missing {missing_display} data")
+                lines.append(f" - {ticker}: missing {missing_display} data")
                 continue
 
-            print(
+            lines.append(
                 f" - {ticker}: pre-split price ${price_val:.4f} -> potential profit ${profit:.4f} ({ratio_display})"
             )
 
+        # One write for the whole report instead of a print per record
+        print("\n".join(lines))
+
 
 def maybe_email(results: List[dict]) -> None:
     sender = os.environ.get("ALERT_SENDER_EMAIL")
@@ -420,21 +526,37 @@ import requests
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+# Complete-submission .txt link on an SEC '-index.html' page
+_RE_HREF_TXT = re.compile(r'href="([^"]+\.txt)"', re.IGNORECASE)
+_RE_PATH_TXT = re.compile(r'(/Archives/edgar/data/[^"\s]+\.txt)', re.IGNORECASE)
+# Standard EDGAR index URL; its complete submission file is "<accession>.txt" in the same folder
+_RE_INDEX_URL = re.compile(
+    r"^(https://www\.sec\.gov/Archives/edgar/data/\d+/\d{18}/)(\d{10}-\d{2}-\d{6})-index\.html?$",
+    re.IGNORECASE,
+)
+
 def _fetch_sec_index_and_find_primary_txt(index_url: str, session: requests.Session) -> str:
     """
     Given an SEC '-index.html' page, find the primary filing .txt URL.
     This avoids quotemedia/3rd party HTML quirks and uses SEC source of truth.
+
+    Standard index URLs map to the .txt name directly (the same derivation
+    edgar uses for Filing.text_url), so the page is only fetched otherwise.
     """
+    m = _RE_INDEX_URL.match(index_url.strip())
+    if m:
+        return f"{m.group(1)}{m.group(2)}.txt"
+
     r = session.get(index_url, timeout=30)
     r.raise_for_status()
     html = r.text
 
     # Common pattern in SEC index pages: a link to the complete submission text file ending in .txt
     # Example: /Archives/edgar/data/.../000xxxxxxx-xx-xxxxxx.txt
-    m = re.search(r'href="([^"]+\.txt)"', html, flags=re.IGNORECASE)
+    m = _RE_HREF_TXT.search(html)
     if not m:
         # fallback: sometimes the .txt is in a different attribute formatting
-        m = re.search(r'(/Archives/edgar/data/[^"\s]+\.txt)', html, flags=re.IGNORECASE)
+        m = _RE_PATH_TXT.search(html)
     if not m:
         raise RuntimeError("Could not find primary .txt filing link on index page")
 
@@ -455,21 +577,30 @@ def explain_would_include(
     event_is_fresh: bool,
     filed_at=None,
     now_et: datetime | None = None,
+    delisting_only: bool | None = None,
+    has_reverse: bool | None = None,
 ) -> tuple[bool, list[str]]:
     """
     Mirrors production gating and returns human-readable reasons.
+
+    Pass delisting_only/has_reverse when the caller already ran those text
+    gates; otherwise they are computed from text.
     """
     if now_et is None:
-        now_et = datetime.now(ZoneInfo("America/New_York"))
+        now_et = datetime.now(NY_TZ)
+    if delisting_only is None:
+        delisting_only = parse.is_delisting_notice_only(text)
+    if has_reverse is None:
+        has_reverse = parse.contains_reverse_split_language(text)
 
     reasons: list[str] = []
 
     # Gate 1: delisting-only
-    if parse.is_delisting_notice_only(text):
+    if delisting_only:
         reasons.append("FAIL: delisting notice only")
 
     # Gate 2: reverse split language
-    if not parse.contains_reverse_split_language(text):
+    if not has_reverse:
         reasons.append("FAIL: no reverse-split language detected")
 
     # Gate 3: freshness (your event-based freshness flag)
@@ -498,6 +629,28 @@ def explain_would_include(
     return would_include, reasons
 
 
+# (pattern, label) pairs printed with surrounding context by debug_two_filings
+_CTX_FLAGS = re.IGNORECASE | re.DOTALL
+_CTX_PATTERNS = (
+    (
+        re.compile(r"\b\d{1,3}(?:,\d{3})*\s*[-–]\s*for\s*[-–]\s*\d{1,3}(?:,\d{3})*\b", _CTX_FLAGS),
+        "hyphenated ratio X-for-Y",
+    ),
+    (
+        re.compile(r"between\s+one[-\s]*for[-\s]*two.*one[-\s]*for[-\s]*ten", _CTX_FLAGS),
+        "ratio RANGE language (authorization)",
+    ),
+    (
+        re.compile(r"implemented\s+effective|will\s+be\s+effective|effective\s+date|market\s+effective\s+date|begin\s+trading\s+on\s+a\s+split-adjusted\s+basis", _CTX_FLAGS),
+        "effective-date language",
+    ),
+    (
+        re.compile(r"fractional\s+share|no\s+fractional\s+shares|rounded\s+up|cash\s+in\s+lieu|paid\s+in\s+cash", _CTX_FLAGS),
+        "fractional/rounding language",
+    ),
+)
+
+
 def debug_two_filings(index_urls: list[str], WINDOW_HOURS: int = 84) -> None:
     runner = Runner()
     print("\n========== DEBUG TWO FILINGS ==========")
@@ -508,11 +661,12 @@ def debug_two_filings(index_urls: list[str], WINDOW_HOURS: int = 84) -> None:
         txt_url = _fetch_sec_index_and_find_primary_txt(idx_url, runner.session)
         print("PRIMARY TXT:", txt_url)
 
-        resp = runner.session.get(txt_url, timeout=30)
-        resp.raise_for_status()
-        text = resp.text
+        # Same streaming reader as production: uuencoded attachments never get buffered
+        with runner.session.get(txt_url, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            text = edgar.read_filing_body(resp)
 
-        now_et = datetime.now(ZoneInfo("America/New_York"))
+        now_et = datetime.now(NY_TZ)
 
         # --- Event freshness gate ---
         event_dt = parse.extract_event_reported_datetime(text)
@@ -530,8 +684,10 @@ def debug_two_filings(index_urls: list[str], WINDOW_HOURS: int = 84) -> None:
 
         print("TXT length:", len(text))
 
-        print("contains_reverse_split_language:", parse.contains_reverse_split_language(text))
-        print("is_delisting_notice_only:", parse.is_delisting_notice_only(text))
+        has_reverse = parse.contains_reverse_split_language(text)
+        delisting_only = parse.is_delisting_notice_only(text)
+        print("contains_reverse_split_language:", has_reverse)
+        print("is_delisting_notice_only:", delisting_only)
 
         # ---- Extraction (MUST happen before include decision) ----
         filed_at_guess = now_et
@@ -545,19 +701,14 @@ def debug_two_filings(index_urls: list[str], WINDOW_HOURS: int = 84) -> None:
         print("  rounding_policy:", extraction.rounding_policy)
 
         # ---- FINAL POLICY DECISION (matches production) ----
-        would_include = (
-            not parse.is_delisting_notice_only(text)
-            and parse.contains_reverse_split_language(text)
-            and event_is_fresh
-            and extraction.effective_date is not None
-        )
-
         would_include, reasons = explain_would_include(
             text=text,
             extraction=extraction,
             event_is_fresh=event_is_fresh,
             filed_at=filed_at_guess,
             now_et=now_et,
+            delisting_only=delisting_only,
+            has_reverse=has_reverse,
         )
 
         print("WOULD_INCLUDE (policy):", would_include)
@@ -565,10 +716,10 @@ def debug_two_filings(index_urls: list[str], WINDOW_HOURS: int = 84) -> None:
             print("  -", r)
 
         # Context helpers unchanged
-        def show_context(pattern: str, label: str, window: int = 220):
-            m = re.search(pattern, text, flags=re.IGNORECASE | re.DOTALL)
+        def show_context(pattern: re.Pattern, label: str, window: int = 220):
+            m = pattern.search(text)
             if not m:
-                print(f"\n[CTX] {label}: NOT FOUND  | pattern={pattern}")
+                print(f"\n[CTX] {label}: NOT FOUND  | pattern={pattern.pattern}")
                 return
             s, e = m.start(), m.end()
             lo = max(0, s - window)
@@ -576,22 +727,8 @@ def debug_two_filings(index_urls: list[str], WINDOW_HOURS: int = 84) -> None:
             print(f"\n[CTX] {label}: FOUND")
             print(text[lo:hi])
 
-        show_context(
-            r"\b\d{1,3}(?:,\d{3})*\s*[-–]\s*for\s*[-–]\s*\d{1,3}(?:,\d{3})*\b",
-            "hyphenated ratio X-for-Y",
-        )
-        show_context(
-            r"between\s+one[-\s]*for[-\s]*two.*one[-\s]*for[-\s]*ten",
-            "ratio RANGE language (authorization)",
-        )
-        show_context(
-            r"implemented\s+effective|will\s+be\s+effective|effective\s+date|market\s+effective\s+date|begin\s+trading\s+on\s+a\s+split-adjusted\s+basis",
-            "effective-date language",
-        )
-        show_context(
-            r"fractional\s+share|no\s+fractional\s+shares|rounded\s+up|cash\s+in\s+lieu|paid\s+in\s+cash",
-            "fractional/rounding language",
-        )
+        for pattern, label in _CTX_PATTERNS:
+            show_context(pattern, label)
 
 
 
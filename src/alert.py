@@ -1,9 +1,15 @@
 import json
+import os
 import smtplib
 from email.message import EmailMessage
 from pathlib import Path
 from typing import List
 
+try:  # optional: C-accelerated JSON
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def render_email_body(results: List[dict]) -> str:
     lines = ["Reverse split opportunities (round-up only):", ""]
@@ -41,7 +47,19 @@ def send_email(results: List[dict], sender: str, password: str, recipients: List
 
 def write_json(path: Path, data) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, default=str))
+    tmp = path.with_name(path.name + ".tmp")
+    # Both backends write UTF-8 text as-is. They still differ on non-finite
+    # floats: orjson writes NaN/Infinity as null, the stdlib as bare NaN/Infinity.
+    if orjson is not None:
+        # Passing datetimes through to default=str keeps the stdlib's "YYYY-MM-DD HH:MM:SS" rendering.
+        tmp.write_bytes(orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        ))
+    else:
+        # json.dump streams chunks into the buffered file instead of building one big string first
+        with tmp.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    os.replace(tmp, path)
 
 
 def write_csv(path: Path, data: List[dict]) -> None:
@@ -51,7 +69,11 @@ def write_csv(path: Path, data: List[dict]) -> None:
 
     path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = list(data[0].keys())
-    with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    # Columns come from the first record; extra keys on later records are
+    # dropped and missing ones written empty (csv writes None as "").
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([row.get(k) for k in fieldnames] for row in data)
+    os.replace(tmp, path)
@@ -1,18 +1,31 @@
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import os
 import re
+import sqlite3
+import sys
+import threading
+import zlib
+
+import xml.etree.ElementTree as ET
 
-import feedparser
 import requests
+from urllib3.util import make_headers
+
+from .jsonio import dumps as _json_dumps, loads as _json_loads, write_atomic as _write_atomic
 
 USER_AGENT = "reverse-split-monitor/0.1 (contact@example.com)"
 
-@dataclass
+_INDEX_URL_TPL = "https://www.sec.gov/Archives/edgar/data/%s/%s/%s-index.html"
+
+
+@dataclass(slots=True, frozen=True)
 class Filing:
     accession: str
     cik: str
@@ -21,55 +34,173 @@ class Filing:
     filed_at: datetime
     link: str
     text_url: str
+    # every ticker the issuer lists, when the source (submissions JSON) reports them
+    tickers: Tuple[str, ...] = ()
+
+    @property
+    def index_url(self) -> str:
+        """EDGAR filing index page, derived from CIK + accession."""
+        return _INDEX_URL_TPL % (int(self.cik), self.accession.replace("-", ""), self.accession)
 
 
 class FilingCache:
+    """
+    Filing text by accession, in a SQLite table.
+
+    Lookups touch only the requested row and each set() commits just that
+    row, so neither startup nor save() scales with the size of the cache
+    (save() only checkpoints this run's writes out of the WAL).
+    WAL mode lets readers proceed while a fetch thread writes. Bodies are
+    stored zlib-compressed (SGML/HTML filing text shrinks ~5x); rows written
+    before compression was added are plain TEXT and still read back as-is.
+    A legacy ``.json`` blob next to the database is imported when the
+    database is first created.
+    """
+
     def __init__(self, path: Path):
         self.path = path
-        self._data: Dict[str, str] = {}
-        self._load()
+        self._lock = threading.Lock()
+        fresh = not path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the fetch thread pool; _lock serializes access.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS filings (accession TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        if fresh:
+            self._migrate_legacy(path.with_suffix(".json"))
 
-    def _load(self) -> None:
-        if self.path.exists():
-            try:
-                self._data = json.loads(self.path.read_text())
-            except json.JSONDecodeError:
-                self._data = {}
+    def _migrate_legacy(self, legacy: Path) -> None:
+        if not legacy.exists():
+            return
+        try:
+            data = _json_loads(legacy.read_bytes())
+        except json.JSONDecodeError:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO filings (accession, text) VALUES (?, ?)",
+                ((acc, zlib.compress(text.encode("utf-8"))) for acc, text in data.items()),
+            )
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._data, indent=2))
+        """
+        Every set() is already committed; this folds the WAL back into the main
+        file, so copying just the .sqlite3 (e.g. a CI cache step) keeps every row.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        """Checkpoint and close the connection; safe to call more than once."""
+        self.save()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def get(self, accession: str) -> Optional[str]:
-        return self._data.get(accession)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM filings WHERE accession = ?", (accession,)
+            ).fetchone()
+        if not row:
+            return None
+        value = row[0]
+        return zlib.decompress(value).decode("utf-8") if isinstance(value, bytes) else value
 
     def set(self, accession: str, text: str) -> None:
-        self._data[accession] = text
+        # Compress outside the lock; zlib releases the GIL, so fetch threads overlap here.
+        blob = zlib.compress(text.encode("utf-8"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO filings (accession, text) VALUES (?, ?)", (accession, blob)
+            )
 
 
 class SeenAccessions:
-    def __init__(self, path: Path):
+    """
+    Accessions already processed, mapped to when they were last seen.
+
+    Stored as an append-only JSONL log of ``[accession, timestamp]`` lines:
+    save() appends only what was added this run, and the log is compacted
+    (atomically rewritten with the newest ``max_entries``) once it holds
+    more than twice that many lines. A legacy ``.json`` dict next to the
+    log is migrated on first load.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 10_000):
         self.path = path
+        self.max_entries = max_entries
         self._seen: Dict[str, float] = {}
+        self._pending: List[str] = []
+        self._lines = 0
+        self._needs_compaction = False
         self._load()
 
     def _load(self) -> None:
         if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        accession, ts = json.loads(line)
+                    except (ValueError, TypeError):
+                        # torn line from an interrupted append; rewrite rather than append after it
+                        self._needs_compaction = True
+                        continue
+                    self._seen.pop(accession, None)
+                    self._seen[accession] = ts
+            return
+
+        legacy = self.path.with_suffix(".json")
+        if legacy.exists():
             try:
-                self._seen = json.loads(self.path.read_text())
+                self._seen = _json_loads(legacy.read_bytes())
             except json.JSONDecodeError:
                 self._seen = {}
+            self._needs_compaction = bool(self._seen)
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._seen, indent=2))
+        self._evict()
+        if self._needs_compaction or self._lines + len(self._pending) > 2 * self.max_entries:
+            _write_atomic(
+                self.path, "".join(json.dumps([a, ts]) + "\n" for a, ts in self._seen.items())
+            )
+            self._lines = len(self._seen)
+            self._needs_compaction = False
+        elif self._pending:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.writelines(self._pending)
+            self._lines += len(self._pending)
+        self._pending.clear()
+
+    def _evict(self) -> None:
+        excess = len(self._seen) - self.max_entries
+        if excess > 0:
+            for accession in list(islice(self._seen, excess)):
+                del self._seen[accession]
 
     def add(self, accession: str) -> None:
-        self._seen[accession] = time.time()
+        # re-insert so a refreshed accession moves to the newest end
+        ts = time.time()
+        self._seen.pop(accession, None)
+        self._seen[accession] = ts
+        self._pending.append(json.dumps([accession, ts]) + "\n")
 
     def __contains__(self, accession: str) -> bool:
         return accession in self._seen
 
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._seen)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
 
 class TickerMap:
     def __init__(self, path: Path):
@@ -80,29 +211,42 @@ class TickerMap:
     def _load(self) -> None:
         if self.path.exists():
             try:
-                self._mapping = json.loads(self.path.read_text())
+                self._mapping = _json_loads(self.path.read_bytes())
             except json.JSONDecodeError:
                 self._mapping = {}
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._mapping, indent=2))
+        _write_atomic(self.path, _json_dumps(self._mapping))
 
     def refresh(self, session: requests.Session, user_agent: str) -> None:
-        if self._mapping and self.path.exists() and (time.time() - self.path.stat().st_mtime) < 7*24*3600:
+        # Maps written before per-CIK "tickers" were tracked are rebuilt unconditionally;
+        # a 304 would otherwise keep them without the field until upstream changes.
+        current = self._mapping and "tickers" in next(iter(self._mapping.values()))
+        if current and self.path.exists() and (time.time() - self.path.stat().st_mtime) < 7*24*3600:
             return
 
+        # ETag/Last-Modified of the payload the mapping was built from, kept beside it
+        validators_path = self.path.with_suffix(".validators.json")
+        validators = _load_json(validators_path, {}) if current else {}
+
         url = "https://www.sec.gov/files/company_tickers_exchange.json"
         resp = _get_with_retries(
             session,
             url,
-            headers=_sec_headers(user_agent),
+            headers=_conditional_headers(user_agent, validators),
             timeout=int(os.environ.get("SEC_TIMEOUT", "90")),
             retries=int(os.environ.get("SEC_RETRIES", "5")),
             backoff=float(os.environ.get("SEC_BACKOFF", "2.0")),
         )
+        if resp.status_code == 304 and self._mapping:
+            os.utime(self.path)  # unchanged upstream: restart the 7-day clock without a rewrite
+            return
         resp.raise_for_status()
         payload = resp.json()
+        # Written only after the mapping: validators newer than the mapping would
+        # turn every later refresh into a 304 that keeps the stale mapping forever.
+        new_validators = _response_validators(resp)
+        listed: Dict[str, List[str]] = {}  # this payload's tickers per CIK, not last week's
 
         if isinstance(payload, dict) and "fields" in payload and "data" in payload:
             fields = payload["fields"]
@@ -119,15 +263,19 @@ class TickerMap:
                     if cik_val is None:
                         continue
                     cik_str = str(int(cik_val)).zfill(10)
+                    ticker = (row[ticker_i] or "").upper() if ticker_i is not None else ""
                     self._mapping[cik_str] = {
-                        "ticker": (row[ticker_i] or "").upper() if ticker_i is not None else "",
+                        "ticker": ticker,
                         "exchange": (row[exch_i] or "").upper() if exch_i is not None else "",
                         "title": row[name_i] if name_i is not None else "",
+                        # every listed class, so derived common tickers can be confirmed
+                        "tickers": _add_ticker(listed, cik_str, ticker),
                     }
                 except Exception:
                     continue
 
             self.save()
+            _save_json(validators_path, new_validators)
             return
 
         it = payload.values() if isinstance(payload, dict) else payload if isinstance(payload, list) else []
@@ -137,16 +285,42 @@ class TickerMap:
             cik_str = str(entry.get("cik_str") or entry.get("cik") or "").zfill(10)
             if not cik_str.strip("0"):
                 continue
+            ticker = str(entry.get("ticker", "")).upper()
             self._mapping[cik_str] = {
-                "ticker": str(entry.get("ticker", "")).upper(),
+                "ticker": ticker,
                 "exchange": str(entry.get("exchange", "")).upper(),
                 "title": str(entry.get("title") or entry.get("name") or ""),
+                "tickers": _add_ticker(listed, cik_str, ticker),
             }
 
         self.save()
+        _save_json(validators_path, new_validators)
 
     def lookup(self, cik: str) -> Dict[str, str]:
-        return self._mapping.get((cik or "").zfill(10), {})
+        """Mapping entry for a CIK with ticker/exchange upper-cased and stripped, or {}."""
+        entry = self._mapping.get((cik or "").zfill(10))
+        if not entry:
+            return {}
+        return {
+            "ticker": (entry.get("ticker") or "").upper().strip(),
+            "exchange": (entry.get("exchange") or "").upper().strip(),
+            "title": entry.get("title", ""),
+        }
+
+    def tickers_for(self, cik: str) -> List[str]:
+        """Every ticker SEC lists for a CIK (maps written before this was tracked only have one)."""
+        entry = self._mapping.get((cik or "").zfill(10))
+        if not entry:
+            return []
+        tickers = entry.get("tickers") or [entry.get("ticker") or ""]
+        return [t.upper().strip() for t in tickers if t and t.strip()]
+
+
+def _add_ticker(listed: Dict[str, List[str]], cik: str, ticker: str) -> List[str]:
+    tickers = listed.setdefault(cik, [])
+    if ticker and ticker not in tickers:
+        tickers.append(ticker)
+    return tickers
 
 
 FORMS_OF_INTEREST = [
@@ -160,9 +334,34 @@ _ACCESSION_RE = re.compile(r"(\d{10}-\d{2}-\d{6})")
 _CIK_RE = re.compile(r"\((\d{10})\)")
 _CIK_IN_LINK_RE = re.compile(r"/data/(\d{1,10})/")
 _FORM_RE = re.compile(r"^([A-Z0-9\-\/ ]+)\s+-\s+")
+_FILER_TRAILER_RE = re.compile(r"\(\d{10}\)\s*\(Filer\)\s*$")
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def _iter_atom_entries(feed_text: str) -> Iterator[dict]:
+    """
+    Yield each Atom <entry> as a plain dict with just the keys _parse_entry
+    reads (title, links, id, updated, published). EDGAR's getcurrent feed is
+    well-formed Atom, so stdlib ElementTree suffices; an unparseable body
+    yields nothing, like a feed with no entries.
+    """
+    try:
+        root = ET.fromstring(feed_text)
+    except ET.ParseError:
+        return
+    for el in root.iter(_ATOM_NS + "entry"):
+        yield {
+            "title": el.findtext(_ATOM_NS + "title"),
+            "links": [{"href": l.get("href")} for l in el.iter(_ATOM_NS + "link")],
+            "id": el.findtext(_ATOM_NS + "id") or "",
+            "updated": el.findtext(_ATOM_NS + "updated"),
+            "published": el.findtext(_ATOM_NS + "published"),
+        }
+
 
 def _first_link_href(entry) -> str:
-    links = getattr(entry, "links", None)
+    links = entry.get("links")
     if links and isinstance(links, list):
         for l in links:
             href = l.get("href") if isinstance(l, dict) else None
@@ -212,11 +411,12 @@ def _parse_entry(entry) -> Optional[Filing]:
     company = title
     if " - " in company:
         company = company.split(" - ", 1)[1]
-    company = re.sub(r"\(\d{10}\)\s*\(Filer\)\s*$", "", company).strip()
+    company = _FILER_TRAILER_RE.sub("", company).strip()
 
     filed_str = entry.get("updated") or entry.get("published") or ""
     if filed_str:
-        filed_at = datetime.strptime(filed_str.split("T")[0], "%Y-%m-%d")
+        # Atom timestamps are ISO 8601; the C fromisoformat beats strptime's format parsing
+        filed_at = datetime.fromisoformat(filed_str[:10])
     else:
         filed_at = datetime.utcnow()
 
@@ -224,18 +424,40 @@ def _parse_entry(entry) -> Optional[Filing]:
 
     return Filing(
         accession=accession,
-        cik=(cik or "").zfill(10),
+        cik=sys.intern((cik or "").zfill(10)),
         company=company,
-        form=form,
+        form=sys.intern(form),
         filed_at=filed_at,
         link=link,
         text_url=text_url,
     )
 
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart, across all threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# SEC allows 10 requests/second per client; every SEC GET goes through this.
+_SEC_LIMITER = _RateLimiter(float(os.environ.get("SEC_MAX_RPS", "8")))
+
+
 def _get_with_retries(session, url, headers, timeout=90, retries=5, backoff=2.0):
     last_exc = None
     for i in range(retries):
         try:
+            _SEC_LIMITER.wait()
             resp = session.get(url, headers=headers, timeout=timeout)
             if resp.status_code in (429, 500, 502, 503, 504):
                 time.sleep(backoff ** i)
@@ -249,14 +471,32 @@ def _get_with_retries(session, url, headers, timeout=90, retries=5, backoff=2.0)
         raise last_exc
     raise requests.exceptions.ReadTimeout(f"Failed to GET {url}")
 
+# Only advertise codings urllib3 can actually decode here ("br" needs the
+# optional brotli package; without it a br body would reach the parser raw).
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
 def _sec_headers(user_agent: str) -> Dict[str, str]:
     return {
         "User-Agent": user_agent,
         "Accept": "application/atom+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Encoding": _ACCEPT_ENCODING,
         "Connection": "keep-alive",
     }
 
+
+def _conditional_headers(user_agent: str, validators: dict) -> Dict[str, str]:
+    """SEC headers plus If-None-Match/If-Modified-Since from a previous response's validators."""
+    headers = _sec_headers(user_agent)
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _response_validators(resp: requests.Response) -> Dict[str, Optional[str]]:
+    return {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+
 # ----------------------------
 # Feed cache fallback
 # ----------------------------
@@ -267,14 +507,48 @@ def _feed_cache_path(data_dir: Path) -> Path:
 def _load_feed_cache(path: Path) -> dict:
     if path.exists():
         try:
-            return json.loads(path.read_text())
+            return _json_loads(path.read_bytes())
         except json.JSONDecodeError:
             return {}
     return {}
 
 def _save_feed_cache(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2))
+    _write_atomic(path, _json_dumps(payload))
+
+def _fetch_form_feed(
+    form: str,
+    session: requests.Session,
+    user_agent: str,
+    *,
+    cached: dict,
+    timeout: int,
+    retries: int,
+    backoff: float,
+) -> Optional[dict]:
+    """
+    Conditional GET for one form's Atom feed.
+
+    Returns a fresh feed-cache entry, or None when SEC answers 304 Not Modified
+    and the cached copy is still current.
+    """
+    url = (
+        "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&owner=include"
+        f"&type={form}&count=200&output=atom"
+    )
+    headers = _conditional_headers(user_agent, cached if cached.get("text") else {})
+
+    resp = _get_with_retries(
+        session,
+        url,
+        headers=headers,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+    )
+    if resp.status_code == 304 and cached.get("text"):
+        return None
+    resp.raise_for_status()
+    return {"fetched_at": time.time(), "text": resp.text, **_response_validators(resp)}
 
 def fetch_recent_filings(
     forms: Iterable[str],
@@ -287,6 +561,7 @@ def fetch_recent_filings(
 ) -> List[Filing]:
     cutoff = datetime.utcnow() - timedelta(hours=window_hours)
     filings: List[Filing] = []
+    seen: set[str] = set()
 
     cache_path = _feed_cache_path(data_dir)
     feed_cache = _load_feed_cache(cache_path)
@@ -294,34 +569,42 @@ def fetch_recent_filings(
     sec_timeout = int(os.environ.get("SEC_TIMEOUT", "90"))
     sec_retries = int(os.environ.get("SEC_RETRIES", "5"))
     sec_backoff = float(os.environ.get("SEC_BACKOFF", "2.0"))
-    sec_delay_s = float(os.environ.get("SEC_DELAY_S", "0.2"))
 
-    for form in forms:
-        url = (
-            "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&owner=include"
-            f"&type={form}&count=200&output=atom"
-        )
+    forms = list(forms)
+    if not forms:
+        return []
 
-        feed_text: Optional[str] = None
-        try:
-            resp = _get_with_retries(
+    # Feeds are independent, network-bound GETs: fetch them concurrently and
+    # keep the results in form order so the output is stable.
+    with ThreadPoolExecutor(max_workers=len(forms)) as ex:
+        futures = [
+            ex.submit(
+                _fetch_form_feed,
+                form,
                 session,
-                url,
-                headers=_sec_headers(user_agent),
+                user_agent,
+                cached=feed_cache.get(form, {}),
                 timeout=sec_timeout,
                 retries=sec_retries,
                 backoff=sec_backoff,
             )
-            resp.raise_for_status()
-            feed_text = resp.text
-
-            feed_cache[form] = {"fetched_at": time.time(), "text": feed_text}
-            _save_feed_cache(cache_path, feed_cache)
-
-            if sec_delay_s > 0:
-                time.sleep(sec_delay_s)
+            for form in forms
+        ]
 
+    cache_dirty = False
+    for form, fut in zip(forms, futures):
+        feed_text: Optional[str] = None
+        try:
+            fresh = fut.result()
+            if fresh is None:
+                # 304 Not Modified: reuse the cached body
+                feed_text = feed_cache[form]["text"]
+            else:
+                feed_cache[form] = fresh
+                feed_text = fresh["text"]
+                cache_dirty = True
         except Exception:
+            # one failing feed shouldn't abort the batch
             if not use_feed_cache_on_failure:
                 raise
             cached = feed_cache.get(form, {})
@@ -329,17 +612,22 @@ def fetch_recent_filings(
             if not feed_text:
                 continue
 
-        parsed = feedparser.parse(feed_text)
-        for entry in parsed.entries:
+        for entry in _iter_atom_entries(feed_text):
             filing = _parse_entry(entry)
             if not filing:
                 continue
             if filing.filed_at < cutoff:
                 continue
+            # co-registrant filings are listed once per filer: keep the first
+            if filing.accession in seen:
+                continue
+            seen.add(filing.accession)
             filings.append(filing)
 
-    unique: Dict[str, Filing] = {f.accession: f for f in filings}
-    return list(unique.values())
+    if cache_dirty:
+        _save_feed_cache(cache_path, feed_cache)
+
+    return filings
 
 
 import re
@@ -355,6 +643,37 @@ def _sec_doc_accession(text: str) -> Optional[str]:
     m = _SEC_DOC_RE.search(text[:2000])  # only need header
     return m.group(1) if m else None
 
+_UUENCODE_BEGIN_RE = re.compile(rb"^begin [0-7]{3} \S")
+
+
+def read_filing_body(resp: requests.Response) -> str:
+    """
+    Stream a full-submission .txt body, dropping uuencoded attachments.
+
+    GRAPHIC/ZIP/PDF/EXCEL documents are embedded as uuencoded blocks
+    ("begin 644 name" ... "end") and are usually most of the bytes in an 8-K
+    submission. Nothing downstream can match in them, so they are skipped
+    chunk by chunk instead of being buffered, cached and regex-scanned.
+    """
+    kept: List[bytes] = []
+    in_binary = False
+    tail = b""
+    for chunk in resp.iter_content(chunk_size=65536):
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            if in_binary:
+                if line.rstrip() == b"end":
+                    in_binary = False
+            elif _UUENCODE_BEGIN_RE.match(line):
+                in_binary = True
+            else:
+                kept.append(line)
+    if tail and not in_binary:
+        kept.append(tail)
+    return b"\n".join(kept).decode(resp.encoding or "utf-8", errors="replace")
+
+
 def fetch_filing_text(filing: Filing, cache: FilingCache, session: requests.Session, user_agent: str) -> Optional[str]:
     """
     Fetch filing submission text. Cache-safe:
@@ -373,19 +692,30 @@ def fetch_filing_text(filing: Filing, cache: FilingCache, session: requests.Sess
     url = filing.text_url
     for i in range(4):
         try:
-            resp = session.get(url, headers=_sec_headers(user_agent), timeout=90)
-        except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError):
-            time.sleep(2 ** i)
-            continue
+            _SEC_LIMITER.wait()
+            with session.get(url, headers=_sec_headers(user_agent), timeout=90, stream=True) as resp:
+                if resp.status_code in (429, 500, 502, 503, 504):
+                    time.sleep(2 ** i)
+                    continue
 
-        if resp.status_code in (429, 500, 502, 503, 504):
+                if resp.status_code != 200:
+                    return None
+
+                # Full submissions are served as text/plain; a non-text body can't
+                # hold filing language, so skip it before reading a byte.
+                content_type = resp.headers.get("Content-Type", "")
+                if content_type and not content_type.startswith("text/"):
+                    return None
+
+                text = read_filing_body(resp)
+        except (
+            requests.exceptions.ReadTimeout,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ):
             time.sleep(2 ** i)
             continue
 
-        if resp.status_code != 200:
-            return None
-
-        text = resp.text or ""
         got = _sec_doc_accession(text)
         if got and got != filing.accession:
             # Don’t cache wrong content
@@ -398,6 +728,32 @@ def fetch_filing_text(filing: Filing, cache: FilingCache, session: requests.Sess
     return None
 
 
+def iter_filing_texts(
+    filings: Iterable[Filing],
+    cache: FilingCache,
+    session: requests.Session,
+    user_agent: str,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[Filing, Optional[str]]]:
+    """
+    Fetch many filing texts concurrently, yielding (filing, text or None) as
+    each download completes rather than in input order.
+
+    Fetching is latency-bound, so a small thread pool overlaps the round-trips
+    while _SEC_LIMITER keeps the aggregate rate under SEC's limit. Yielding on
+    completion lets callers start parsing before the slowest fetch returns.
+    """
+    filings = list(filings)
+    if not filings:
+        return
+
+    workers = max_workers or int(os.environ.get("SEC_FETCH_WORKERS", "8"))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(filings)))) as ex:
+        futures = {ex.submit(fetch_filing_text, f, cache, session, user_agent): f for f in filings}
+        for fut in as_completed(futures):
+            yield futures[fut], fut.result()
+
+
 # ---------------------------------------------------------------------------
 # CIK-direct fetch via SEC submissions JSON (reliable for a specific company)
 # ---------------------------------------------------------------------------
@@ -408,8 +764,8 @@ def _accession_nodash(accession: str) -> str:
 def fetch_company_tickers_from_submissions(cik: str, session: requests.Session, user_agent: str) -> List[str]:
     cik10 = str(int(cik)).zfill(10)
     url = f"https://data.sec.gov/submissions/CIK{cik10}.json"
-    headers = {"User-Agent": user_agent, "Accept-Encoding": "gzip, deflate"}
-    r = session.get(url, headers=headers, timeout=30)
+    headers = {"User-Agent": user_agent, "Accept-Encoding": _ACCEPT_ENCODING}
+    r = _get_with_retries(session, url, headers=headers, timeout=30, retries=3)
     r.raise_for_status()
     j = r.json()
     return [t.upper() for t in (j.get("tickers") or []) if isinstance(t, str)]
@@ -451,6 +807,7 @@ def fetch_company_filings_from_submissions(
     payload = resp.json()
 
     company_name = (payload.get("name") or "").strip() or cik10
+    tickers = tuple(t.upper() for t in (payload.get("tickers") or []) if isinstance(t, str))
 
     recent = (payload.get("filings") or {}).get("recent") or {}
     forms_arr = recent.get("form") or []
@@ -484,7 +841,7 @@ def fetch_company_filings_from_submissions(
         if not acc_no:
             continue
 
-        link = f"https://www.sec.gov/Archives/edgar/data/{cik_int}/{acc_no}/{accession}-index.html"
+        link = _INDEX_URL_TPL % (cik_int, acc_no, accession)
         # SEC "full submission text" is usually the dashed accession filename
         text_url = f"https://www.sec.gov/Archives/edgar/data/{cik_int}/{acc_no}/{accession}.txt"
 
@@ -494,10 +851,11 @@ def fetch_company_filings_from_submissions(
                 accession=accession,
                 cik=cik10,
                 company=company_name,
-                form=form,
+                form=sys.intern(form),  # a handful of distinct values across thousands of rows
                 filed_at=filed_at,
                 link=link,
                 text_url=text_url,
+                tickers=tickers,
             )
         )
 
@@ -516,14 +874,13 @@ def _universe_cursor_path(data_dir: Path) -> Path:
 def _load_json(path: Path, default):
     try:
         if path.exists():
-            return json.loads(path.read_text(encoding="utf-8"))
+            return _json_loads(path.read_bytes())
     except Exception:
         pass
     return default
 
 def _save_json(path: Path, obj) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    _write_atomic(path, _json_dumps(obj))
 
 def get_cik_universe(
     session: requests.Session,
@@ -548,14 +905,17 @@ def get_cik_universe(
         resp = _get_with_retries(
             session,
             url,
-            headers=_sec_headers(user_agent),
+            headers=_conditional_headers(user_agent, cache if payload else {}),
             timeout=int(os.environ.get("SEC_TIMEOUT", "90")),
             retries=int(os.environ.get("SEC_RETRIES", "5")),
             backoff=float(os.environ.get("SEC_BACKOFF", "2.0")),
         )
-        resp.raise_for_status()
-        payload = resp.json()
-        cache = {"fetched_at": now, "payload": payload}
+        if resp.status_code == 304 and payload:
+            cache["fetched_at"] = now
+        else:
+            resp.raise_for_status()
+            payload = resp.json()
+            cache = {"fetched_at": now, "payload": payload, **_response_validators(resp)}
         _save_json(cache_path, cache)
 
     ciks: List[str] = []
@@ -639,12 +999,9 @@ def fetch_recent_filings_via_submissions_universe(
     if debug:
         print(f"[universe] scanning batch_size={len(batch)} cursor={cursor}->{new_cursor} universe_size={len(universe)} window_days={window_days}")
 
-    out: List[Filing] = []
-    sec_delay_s = float(os.environ.get("SEC_DELAY_S", "0.4"))
-
-    for i, cik in enumerate(batch, 1):
+    def scan(cik: str) -> List[Filing]:
         try:
-            more = fetch_company_filings_from_submissions(
+            return fetch_company_filings_from_submissions(
                 cik,
                 session,
                 user_agent,
@@ -652,16 +1009,20 @@ def fetch_recent_filings_via_submissions_universe(
                 window_days=window_days,
                 limit=limit_per_cik,
             )
-            out.extend(more)
         except Exception:
             # keep going; one issuer failing shouldn't kill the run
-            pass
+            return []
 
-        if sec_delay_s > 0:
-            time.sleep(sec_delay_s)
+    # Pacing comes from _SEC_LIMITER inside _get_with_retries, so the pool can
+    # keep requests in flight at the allowed rate instead of sleeping per CIK.
+    out: List[Filing] = []
+    workers = int(os.environ.get("SEC_FETCH_WORKERS", "8"))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batch)))) as ex:
+        for i, more in enumerate(ex.map(scan, batch), 1):
+            out.extend(more)
 
-        if debug and i % 200 == 0:
-            print(f"[universe] scanned {i}/{len(batch)} CIKs; filings={len(out)}")
+            if debug and i % 200 == 0:
+                print(f"[universe] scanned {i}/{len(batch)} CIKs; filings={len(out)}")
 
     # De-dupe by accession
     uniq = {f.accession: f for f in out if f and f.accession}
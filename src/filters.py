@@ -25,11 +25,12 @@ ETF_TEXT_KEYWORDS = [
 ]
 
 # Canada detection should primarily use metadata (exchange / country), not random text mentions.
-CANADA_EXCHANGES = {"TSX", "TSXV", "CSE", "NEO", "CNQ"}  # common Canadian venues
-CANADA_TITLE_EXPLICIT = [
+CANADA_EXCHANGES = frozenset({"TSX", "TSXV", "CSE", "NEO", "CNQ"})  # common Canadian venues
+CANADA_COUNTRIES = frozenset({"CA", "CAN", "CANADA"})
+CANADA_TITLE_EXPLICIT = (
     " inc. (canada)", # very explicit
     " corp. (canada)",
-]
+)
 
 def _norm(s: str) -> str:
     return (s or "").strip().lower()
@@ -47,6 +48,13 @@ _ADR_TITLE_RE = re.compile(
 # not the entire filing body.
 _HDR_SLICE_CHARS = 12000  # enough to capture <SEC-HEADER> and early cover page
 
+_ADR_STRONG_PHRASES = (
+    "american depositary",
+    "american depository",
+    "depositary receipt",
+    "depositary share",
+)
+
 def is_adr(text: str, meta: SecurityInfo) -> bool:
     """
     Return True only with strong evidence of ADR/ADS.
@@ -68,8 +76,7 @@ def is_adr(text: str, meta: SecurityInfo) -> bool:
     if head and _ADR_TITLE_RE.search(head):
         # To reduce false positives further, require at least one strong phrase,
         # or ADR/ADS as standalone token near "depositary"
-        hl = head.lower()
-        if ("american depositary" in hl) or ("american depository" in hl) or ("depositary receipt" in hl) or ("depositary share" in hl):
+        if any(p in head for p in _ADR_STRONG_PHRASES):
             return True
 
         # If it is only 'adr'/'ads' without any depositary wording, treat as NOT ADR
@@ -78,6 +85,18 @@ def is_adr(text: str, meta: SecurityInfo) -> bool:
     return False
 
 
+_ETF_STRONG_SIGNALS = (
+    "exchange-traded fund",
+    "exchange traded fund",
+    "open-end fund",
+    "closed-end fund",
+)
+_ETF_WEAK_SIGNALS = (
+    "investment company act of 1940",
+    "unit investment trust",
+)
+
+
 def is_etf(text: str, meta: SecurityInfo) -> bool:
     title = _norm(meta.title)
     if " etf" in f" {title} " or title.endswith(" etf") or title.startswith("etf "):
@@ -85,22 +104,10 @@ def is_etf(text: str, meta: SecurityInfo) -> bool:
 
     t = _norm(text)
 
-    strong_signals = [
-        "exchange-traded fund",
-        "exchange traded fund",
-        "open-end fund",
-        "closed-end fund",
-    ]
-    weak_signals = [
-        "investment company act of 1940",
-        "unit investment trust",
-    ]
-
-    strong = any(s in t for s in strong_signals)
-    weak = sum(1 for s in weak_signals if s in t)
-
-    # require either a strong signal, or 2+ weak signals
-    return strong or weak >= 2
+    # require either a strong signal, or 2+ weak signals; stop at the first strong hit
+    if any(s in t for s in _ETF_STRONG_SIGNALS):
+        return True
+    return sum(1 for s in _ETF_WEAK_SIGNALS if s in t) >= 2
 
 def is_canadian(text: str, meta: SecurityInfo) -> bool:
     """
@@ -113,7 +120,7 @@ def is_canadian(text: str, meta: SecurityInfo) -> bool:
     title = _norm(meta.title)
 
     # 1) Strongest signal: explicit country metadata
-    if country in {"CA", "CAN", "CANADA"}:
+    if country in CANADA_COUNTRIES:
         return True
 
     # 2) Strong signal: Canadian exchange
@@ -122,10 +129,8 @@ def is_canadian(text: str, meta: SecurityInfo) -> bool:
 
     # 3) Extremely conservative fallback: explicit issuer naming
     #    (Optional — you can delete this block entirely if you want zero risk)
-    if title:
-        for pat in CANADA_TITLE_EXPLICIT:
-            if pat in title:
-                return True
+    if title and any(pat in title for pat in CANADA_TITLE_EXPLICIT):
+        return True
 
     # Default: NOT Canadian
     return False
@@ -143,12 +148,16 @@ def is_non_common_security(meta: SecurityInfo) -> bool:
 
 
 def passes_security_filters(text: str, meta: SecurityInfo) -> bool:
-    return not (is_adr(text, meta) or is_etf(text, meta) or is_canadian(text, meta))
+    # Cheapest first: Canada is metadata-only, ADR scans the header, ETF scans the full text.
+    return not (is_canadian(text, meta) or is_adr(text, meta) or is_etf(text, meta))
+
+
+# Only filings that round fractional shares up are eligible
+ALLOWED_ROUNDING_POLICIES = frozenset({ROUND_UP})
 
 
 def passes_rounding_policy(policy: str) -> bool:
-    # Keep UNKNOWN allowed during tuning; tighten later if you want ROUND_UP only
-    return policy in (ROUND_UP)
+    return policy in ALLOWED_ROUNDING_POLICIES
 
 
 def passes_price_threshold(price: Optional[float], ratio_new: Optional[int], ratio_old: Optional[int]) -> bool:
@@ -0,0 +1,35 @@
+# jsonio.py
+"""JSON cache I/O shared by the EDGAR and price caches."""
+import json
+import os
+from pathlib import Path
+
+try:  # optional: C-accelerated JSON for the large cache files
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_atomic(path: Path, data) -> None:
+    """Write str/bytes via a sibling temp file + os.replace so a crash never leaves a torn file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def dumps(obj):
+    """Indented JSON as bytes (orjson) or str (stdlib fallback); non-ASCII stays UTF-8 either way."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def loads(data):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' except clauses still apply
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
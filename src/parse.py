@@ -1,6 +1,7 @@
 import re
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
+from datetime import date, datetime
 from typing import List, Optional
 
 from dateutil import parser as dateparser
@@ -112,10 +113,16 @@ PROSE_CONSOLIDATION_FOR_EVERY = re.compile(
     re.IGNORECASE | re.DOTALL
 )
 
+# Definitive hyphenated "X-for-Y" ratio (used to override range/authorization language)
+_HYPHEN_RATIO_RE = re.compile(r"\b\d{1,3}(?:,\d{3})*\s*-\s*for\s*-\s*\d{1,3}(?:,\d{3})*\b")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_NON_ALPHA_RE = re.compile(r"[^a-z\s-]")
+
 # Normalize common Unicode dashes to ASCII "-"
 _DASHES = "\u2010\u2011\u2012\u2013\u2014\u2015\u2212"
 _DASH_RE = re.compile(f"[{_DASHES}]")
 
+@lru_cache(maxsize=2)
 def _norm_text_html(s: str) -> str:
     """
     Normalizes SEC HTML-ish text so regexes can match reliably:
@@ -123,6 +130,10 @@ def _norm_text_html(s: str) -> str:
       - collapse NBSP to spaces
       - normalize unicode dashes/quotes
       - collapse whitespace
+
+    Memoized: extract_details hands the same full filing text to several
+    extractors, each of which normalizes it first. The reuse is all within
+    one filing, so the cache is kept tiny; every entry pins a whole body.
     """
     if not s:
         return ""
@@ -133,6 +144,12 @@ def _norm_text_html(s: str) -> str:
     return " ".join(s.split())
 
 
+@lru_cache(maxsize=2)
+def _norm_text_html_lower(s: str) -> str:
+    """Lowercased _norm_text_html(s), memoized for the same reason."""
+    return _norm_text_html(s).lower()
+
+
 def extract_ratio(text: str, debug_label: str = "") -> Tuple[Optional[int], Optional[int]]:
     """
     Returns (ratio_new, ratio_old) where ratio is "new-for-old".
@@ -142,14 +159,14 @@ def extract_ratio(text: str, debug_label: str = "") -> Tuple[Optional[int], Opti
         return None, None
 
     t = _norm_text_html(text)
-    tl = t.lower()
+    tl = _norm_text_html_lower(text)
 
         # Guardrail: authorization/range language (not a finalized split)
     if ("ratio of between" in tl or "within a range" in tl or "to be determined by our board" in tl) and \
        ("one-for-two" in tl and "one-for-ten" in tl) and \
        ("exact ratio" in tl or "to be determined" in tl or "in its discretion" in tl):
         # If there's no definitive numeric hyphenated X-for-Y, don't guess.
-        if not re.search(r"\b\d{1,3}(?:,\d{3})*\s*-\s*for\s*-\s*\d{1,3}(?:,\d{3})*\b", tl):
+        if not _HYPHEN_RATIO_RE.search(tl):
             return None, None
 
 
@@ -224,7 +241,7 @@ def extract_ratio(text: str, debug_label: str = "") -> Tuple[Optional[int], Opti
             return False
 
         # Otherwise keep the conservative date filter
-        if any(mo in w for mo in MONTH_WORDS) and re.search(r"\b(19|20)\d{2}\b", w) and "," in w:
+        if any(mo in w for mo in MONTH_WORDS) and _YEAR_RE.search(w) and "," in w:
             return True
 
         if "date of report" in w or "dated" in w:
@@ -232,8 +249,6 @@ def extract_ratio(text: str, debug_label: str = "") -> Tuple[Optional[int], Opti
 
         return False
 
-    import re
-
     _NUMWORDS = {
         "zero":0,"one":1,"two":2,"three":3,"four":4,"five":5,"six":6,"seven":7,"eight":8,"nine":9,"ten":10,
         "eleven":11,"twelve":12,"thirteen":13,"fourteen":14,"fifteen":15,"sixteen":16,"seventeen":17,"eighteen":18,"nineteen":19,
@@ -243,7 +258,7 @@ def extract_ratio(text: str, debug_label: str = "") -> Tuple[Optional[int], Opti
 
     def words_to_int(s: str) -> int | None:
         s = s.lower()
-        s = re.sub(r"[^a-z\s-]", " ", s)
+        s = _NON_ALPHA_RE.sub(" ", s)
         s = s.replace("-", " ")
         tokens = [t for t in s.split() if t not in ("and",)]
         if not tokens:
@@ -414,10 +429,11 @@ def extract_ratio(text: str, debug_label: str = "") -> Tuple[Optional[int], Opti
         window = tl[max(0, m.start() - 220): min(len(tl), m.end() + 220)]
         candidates.append((score_candidate(m.start(), m.end(), new, old), new, old, m.group(0), window))
 
-    if "shareholders will receive" in tl:
+    # Diagnostics only when a caller asks for them (an extra full finditer pass otherwise)
+    if debug_label and "shareholders will receive" in tl:
         i = tl.find("shareholders will receive")
-        print("[DEBUG] receive-snippet:", tl[i:i+250])
-        print("[DEBUG] prose matches:", len(list(PROSE_RECEIVE_WORDS_PATTERN.finditer(tl))))
+        print(f"[DEBUG {debug_label}] receive-snippet:", tl[i:i+250])
+        print(f"[DEBUG {debug_label}] prose matches:", len(list(PROSE_RECEIVE_WORDS_PATTERN.finditer(tl))))
 
 
     # Prose: each/every ... (N) shares ... into (M) shares
@@ -566,7 +582,22 @@ _DELISTING_PATTERNS = [
     r"subject to delisting",
 ]
 
-_DELISTING_RE = re.compile("|".join(_DELISTING_PATTERNS), re.IGNORECASE)
+# Matched against already-lowercased text: a case-sensitive scan is ~3x faster
+# than IGNORECASE on large bodies.
+_DELISTING_RE = re.compile("|".join(_DELISTING_PATTERNS))
+
+# Every _DELISTING_PATTERNS entry contains one of these whitespace-free words,
+# so a filing with none of them can't match and skips the normalized copy.
+# Keep in sync when adding patterns.
+_DELISTING_HINTS = ("3.01", "delisting", "nasdaq", "deficiency", "bid", "compliance")
+
+_STRONG_EXECUTION_PHRASES = (
+    "we effected a reverse stock split",
+    "the reverse stock split became effective",
+    "effective as of",
+    "will begin trading on a split-adjusted basis",
+    "amendment to the certificate of incorporation was filed",
+)
 
 def is_delisting_notice_only(text: str) -> bool:
     """
@@ -576,21 +607,20 @@ def is_delisting_notice_only(text: str) -> bool:
     if not text:
         return False
 
-    t = " ".join(text.split())
+    tl = text.lower()
+    if not any(h in tl for h in _DELISTING_HINTS):
+        return False
+    return _is_delisting_notice_only_norm(" ".join(tl.split()))
+
+
+def _is_delisting_notice_only_norm(t: str) -> bool:
+    """is_delisting_notice_only on text already lowercased and whitespace-collapsed."""
     if not _DELISTING_RE.search(t):
         return False
 
     # If it ALSO contains strong execution language, do NOT exclude.
     # (We only want to drop pure compliance notices.)
-    strong_execution = [
-        "we effected a reverse stock split",
-        "the reverse stock split became effective",
-        "effective as of",
-        "will begin trading on a split-adjusted basis",
-        "amendment to the certificate of incorporation was filed",
-    ]
-    tl = t.lower()
-    if any(s in tl for s in strong_execution):
+    if any(s in t for s in _STRONG_EXECUTION_PHRASES):
         return False
 
     return True
@@ -599,6 +629,22 @@ from typing import Optional
 from dateutil import parser as dtparser
 import re
 from datetime import datetime
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(raw: str) -> Optional[datetime]:
+    """
+    Fuzzy-parse a matched date string, or None if dateutil rejects it.
+
+    The same few date strings are matched over and over (every trigger window,
+    every candidate pattern), so memoize instead of re-running dateutil.
+    """
+    try:
+        return dtparser.parse(raw, fuzzy=True)
+    except Exception:
+        return None
+
+
 # --- replace your effective-date patterns + extract_effective_date with this ---
 
 # (the “Effective Time”) variants show up a lot
@@ -681,6 +727,25 @@ NUM_DATE_ANYWHERE = re.compile(
     re.IGNORECASE,
 )
 
+# Both date shapes in one alternation so a window is walked once
+_ANY_DATE_RE = re.compile(
+    r"(?P<mdy>[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})|(?P<num>\d{1,2}/\d{1,2}/\d{2,4})",
+    re.IGNORECASE,
+)
+
+def _first_date_in(window: str) -> Optional[re.Match]:
+    """
+    First month-name date in the window, else the first numeric date.
+    Same preference as searching MONTH_DATE_ANYWHERE then NUM_DATE_ANYWHERE.
+    """
+    first_num = None
+    for dm in _ANY_DATE_RE.finditer(window):
+        if dm.lastgroup == "mdy":
+            return dm
+        if first_num is None:
+            first_num = dm
+    return first_num
+
 # Phrases that usually precede the MARKET effective date
 EFFECTIVE_TRIGGERS = [
     # highest signal
@@ -730,14 +795,13 @@ def _find_dates_near_triggers(text: str, filed_at: Optional[datetime] = None) ->
             window = t[start:end]
 
             # find the first plausible date in the window (month-name preferred)
-            dm = MONTH_DATE_ANYWHERE.search(window) or NUM_DATE_ANYWHERE.search(window)
+            dm = _first_date_in(window)
             if not dm:
                 continue
 
-            raw = dm.group("date")
-            try:
-                dt = dtparser.parse(raw, fuzzy=True)
-            except Exception:
+            raw = dm.group(dm.lastgroup)
+            dt = _parse_date(raw)
+            if dt is None:
                 continue
 
             ctx = window[max(0, dm.start()-200): min(len(window), dm.end()+200)]
@@ -794,6 +858,17 @@ IMPLEMENTED_EFFECTIVE_RE = re.compile(
     re.IGNORECASE
 )
 
+# Direct “implemented effective <date>” candidates (treated as MARKET)
+_IMPLEMENTED_EFFECTIVE_PATTERNS = [
+    re.compile(r"\bimplemented\s+effective\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
+    re.compile(r"\bimplemented\s+on\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
+    re.compile(r"\bmarket\s+effective\s+date\b.{0,400}?(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE | re.DOTALL),
+
+    # NEW: market trading phrasing (covers your edge case)
+    re.compile(r"\bbegin(?:s)?\s+to\s+trade\b.{0,400}?\bon\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b",
+            re.IGNORECASE | re.DOTALL),
+]
+
 
 from datetime import datetime, timedelta
 from typing import Optional
@@ -818,10 +893,9 @@ def extract_effective_date(text: str, filed_at: Optional[datetime] = None) -> Op
     # 0) explicit Effective Time definition (highest precision)
     m = EFFECTIVE_TIME_DEF_PATTERN.search(t)
     if m:
-        try:
-            return dtparser.parse(m.group("date"), fuzzy=True)
-        except Exception:
-            pass
+        dt = _parse_date(m.group("date"))
+        if dt is not None:
+            return dt
 
     market_candidates: list[tuple[int, datetime, str]] = []
     other_candidates: list[tuple[int, datetime, str]] = []
@@ -864,22 +938,11 @@ def extract_effective_date(text: str, filed_at: Optional[datetime] = None) -> Op
 
 
     # --- NEW: direct “implemented effective <date>” candidates (treat as MARKET) ---
-    IMPLEMENTED_EFFECTIVE_PATTERNS = [
-        re.compile(r"\bimplemented\s+effective\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
-        re.compile(r"\bimplemented\s+on\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
-        re.compile(r"\bmarket\s+effective\s+date\b.*?(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE | re.DOTALL),
-
-        # NEW: market trading phrasing (covers your edge case)
-        re.compile(r"\bbegin(?:s)?\s+to\s+trade\b.*?\bon\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b",
-                re.IGNORECASE | re.DOTALL),
-    ]
-
-    for pat in IMPLEMENTED_EFFECTIVE_PATTERNS:
+    for pat in _IMPLEMENTED_EFFECTIVE_PATTERNS:
         for m in pat.finditer(t):
             raw = m.group("date")
-            try:
-                dt = dtparser.parse(raw, fuzzy=True)
-            except Exception:
+            dt = _parse_date(raw)
+            if dt is None:
                 continue
 
             # give it a very good score; it is explicitly "effective"
@@ -904,9 +967,8 @@ def extract_effective_date(text: str, filed_at: Optional[datetime] = None) -> Op
     for pat in DATE_CANDIDATE_PATTERNS:
         for m in pat.finditer(t):
             raw = m.group("date")
-            try:
-                dt = dtparser.parse(raw, fuzzy=True)
-            except Exception:
+            dt = _parse_date(raw)
+            if dt is None:
                 continue
 
             start = max(0, m.start() - 260)
@@ -954,10 +1016,11 @@ def extract_effective_date(text: str, filed_at: Optional[datetime] = None) -> Op
     lower = best_ctx.lower()
 
     looks_non_market = any(rx.search(lower) for rx in NON_EFFECTIVE_NEGATIVES)
-    saw_market_anywhere = any(trig.search(t.lower()) for trig, _ in EFFECTIVE_TRIGGERS)
-
-    if looks_non_market and not saw_market_anywhere:
-        return None
+    if looks_non_market:
+        # Lowercase the full document once, not once per trigger
+        tl = _norm_text_html_lower(text)
+        if not any(trig.search(tl) for trig, _ in EFFECTIVE_TRIGGERS):
+            return None
 
     return best_dt
 
@@ -971,12 +1034,15 @@ def _norm_text_basics(s: str) -> str:
     s = s.replace("“", '"').replace("”", '"').replace("’", "'").replace("‘", "'")
     return " ".join(s.split())
 
+_CTX_RATIO_HYPHEN_RE = re.compile(r"\b\d{1,4}\s*-\s*for\s*-\s*\d{1,4}\b")
+_CTX_RATIO_PLAIN_RE = re.compile(r"\b\d{1,4}\s*for\s*\d{1,4}\b")
+
 def extract_reverse_split_context(text: str, window: int = 6500) -> str:
     if not text:
         return ""
 
     t = _norm_text_html(text)
-    tl = t.lower()
+    tl = _norm_text_html_lower(text)
 
     anchors = [
         "effective time",
@@ -1036,7 +1102,7 @@ def extract_reverse_split_context(text: str, window: int = 6500) -> str:
         if "reverse split" in s: sc += 50
         if "fractional" in s: sc += 30
         if "rounded up" in s or "round up" in s: sc += 30
-        if re.search(r"\b\d{1,4}\s*-\s*for\s*-\s*\d{1,4}\b", s) or re.search(r"\b\d{1,4}\s*for\s*\d{1,4}\b", s):
+        if _CTX_RATIO_HYPHEN_RE.search(s) or _CTX_RATIO_PLAIN_RE.search(s):
             sc += 40
 
         # penalize the common trap that caused PRPH
@@ -1051,24 +1117,35 @@ def extract_reverse_split_context(text: str, window: int = 6500) -> str:
     return candidates[0][1]
 
 
+_REVERSE_SPLIT_PHRASES = (
+    "reverse stock split",
+    "reverse split",
+    "split-adjusted",  # also covers "trading on a split-adjusted basis"
+    "reverse-stock split",
+    # NEW (OCG / FPIs):
+    "share consolidation",
+    "stock consolidation",
+    "consolidation of shares",
+    "post-consolidation",
+    "pre-consolidation",
+)
+
+
 def contains_reverse_split_language(text: str) -> bool:
-    t = " ".join((text or "").lower().split())
+    tl = (text or "").lower()
 
-    strong = [
-        "reverse stock split",
-        "reverse split",
-        "split-adjusted",
-        "trading on a split-adjusted basis",
-        "reverse-stock split",
-        # NEW (OCG / FPIs):
-        "share consolidation",
-        "stock consolidation",
-        "consolidation of shares",
-        "post-consolidation",
-        "pre-consolidation",
-    ]
+    # Every phrase contains "split" or "consolidation", and whitespace
+    # normalization can't create either word, so most filings exit here
+    # without paying for the normalized copy.
+    if "split" not in tl and "consolidation" not in tl:
+        return False
+
+    return _contains_reverse_split_language_norm(" ".join(tl.split()))
 
-    if any(k in t for k in strong):
+
+def _contains_reverse_split_language_norm(t: str) -> bool:
+    """contains_reverse_split_language on text already lowercased and whitespace-collapsed."""
+    if any(k in t for k in _REVERSE_SPLIT_PHRASES):
         # Guard: avoid matching generic “consolidated financial statements”
         if "consolidated financial statements" in t and (
             "share consolidation" not in t and "stock consolidation" not in t
@@ -1166,34 +1243,46 @@ _TRADING_TABLE_ROW = re.compile(
 )
 
 
+_WS_RE = re.compile(r"\s+")
+
+# 8-K trading-symbol table header language
+_TRADING_TABLE_TITLE_RE = re.compile(r"Title\s+of\s+each\s+class", re.IGNORECASE)
+_TRADING_TABLE_SCAN_CHARS = 50_000  # raw chars from the header; the table sits right after it
+_TRADING_TABLE_ANCHOR_RE = re.compile(
+    r"Title of each class.*?Trading Symbol.*?Name of each exchange",
+    re.IGNORECASE,
+)
+
+# A row that clearly refers to Common Stock / Ordinary Shares
+_TRADING_TABLE_COMMON_ROW_RE = re.compile(
+    r"(Common Stock|Ordinary Shares|Class A Common Stock|Class B Common Stock)"
+    r".{0,200}?\b([A-Z]{1,6})\b"
+    r".{0,200}?\b(NASDAQ|NYSE|AMEX|NYSE ARCA|NYSEARCA)\b",
+    re.IGNORECASE,
+)
+
+
 def extract_common_ticker_exchange(text: str) -> Tuple[Optional[str], Optional[str]]:
     if not text:
         return None, None
 
-    # compress whitespace to make tables searchable
-    t = re.sub(r"\s+", " ", text)
-
     # Hard anchor on the 8-K trading-symbol table header language
-    # (this appears in most 8-Ks when they list class / symbol / exchange)
-    anchor = re.search(
-        r"Title of each class.*?Trading Symbol.*?Name of each exchange",
-        t,
-        flags=re.IGNORECASE,
-    )
-    if not anchor:
+    # (this appears in most 8-Ks when they list class / symbol / exchange).
+    # Find the header on the raw text, then compress whitespace in a bounded
+    # slice from there instead of across the whole filing and its exhibits.
+    for title in _TRADING_TABLE_TITLE_RE.finditer(text):
+        t = _WS_RE.sub(" ", text[title.start(): title.start() + _TRADING_TABLE_SCAN_CHARS])
+        anchor = _TRADING_TABLE_ANCHOR_RE.match(t)
+        if anchor:
+            break
+    else:
         return None, None
 
     # Only search a limited window AFTER the header (avoid scanning whole doc)
     window = t[anchor.end(): anchor.end() + 2000]
 
     # Now look for a row that clearly refers to Common Stock / Ordinary Shares
-    m = re.search(
-        r"(Common Stock|Ordinary Shares|Class A Common Stock|Class B Common Stock)"
-        r".{0,200}?\b([A-Z]{1,6})\b"
-        r".{0,200}?\b(NASDAQ|NYSE|AMEX|NYSE ARCA|NYSEARCA)\b",
-        window,
-        flags=re.IGNORECASE,
-    )
+    m = _TRADING_TABLE_COMMON_ROW_RE.search(window)
     if not m:
         return None, None
 
@@ -1230,7 +1319,7 @@ APPROVAL_TRIGGERS = [
 
 
 # Month-name dates (extend if you also want numeric and ISO)
-_DATE_ANY = re.compile(r"(?P<date>[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})")
+_DATE_ANY = MONTH_DATE_ANYWHERE
 
 # High-signal "market/trading" triggers (priority order below)
 _MARKET_TRIGGERS: List[Tuple[str, re.Pattern]] = [
@@ -1250,6 +1339,14 @@ _MARKET_PRIORITY = {
     "effective_time": 4,
 }
 
+# “implemented effective …” style (ABQQ / FINRA language)
+_MARKET_IMPLEMENTED_PATTERNS: List[re.Pattern] = [
+    re.compile(r"\bimplemented\s+effective\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
+    re.compile(r"\bimplemented\s+on\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
+    re.compile(r"\b(became|becomes)\s+effective\s+on\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
+    re.compile(r"\bmarket\s+effective\s+date\b.{0,400}?(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE | re.DOTALL),
+]
+
 _PLACEHOLDER_RE = re.compile(r"\[.*?trading date.*?\]|\[expected.*?\]|\[.*?\]", re.IGNORECASE)
 
 def extract_effective_date_market_priority(text: str, filed_at: Optional[datetime] = None) -> Optional[datetime]:
@@ -1268,7 +1365,7 @@ def extract_effective_date_market_priority(text: str, filed_at: Optional[datetim
         return None
 
     t = _norm_text_html(text)
-    tl = t.lower()
+    tl = _norm_text_html_lower(text)
 
     candidates: List[Tuple[int, datetime, str]] = []  # (priority, dt, trigger_name)
 
@@ -1284,28 +1381,19 @@ def extract_effective_date_market_priority(text: str, filed_at: Optional[datetim
                 continue
 
             raw = dm.group("date")
-            try:
-                dt = dtparser.parse(raw, fuzzy=True)
-            except Exception:
+            dt = _parse_date(raw)
+            if dt is None:
                 continue
 
             candidates.append((pr, dt, name))
 
     # 2) NEW: “implemented effective …” style (ABQQ / FINRA language)
     # We treat this as MARKET strength (high priority).
-    IMPLEMENTED_EFFECTIVE_PATTERNS = [
-        re.compile(r"\bimplemented\s+effective\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
-        re.compile(r"\bimplemented\s+on\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
-        re.compile(r"\b(became|becomes)\s+effective\s+on\s+(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE),
-        re.compile(r"\bmarket\s+effective\s+date\b.*?(?P<date>[A-Za-z]+\s+\d{1,2},\s+\d{4})\b", re.IGNORECASE | re.DOTALL),
-    ]
-
-    for pat in IMPLEMENTED_EFFECTIVE_PATTERNS:
+    for pat in _MARKET_IMPLEMENTED_PATTERNS:
         for m in pat.finditer(t):
             raw = m.group("date")
-            try:
-                dt = dtparser.parse(raw, fuzzy=True)
-            except Exception:
+            dt = _parse_date(raw)
+            if dt is None:
                 continue
 
             # priority 0 = "as good as it gets"
@@ -1352,13 +1440,14 @@ def extract_details(text: str, filed_at: datetime) -> Extraction:
         rounding = UNKNOWN
     else:
         rounding = classify_rounding_policy(ctx)
-        if rounding == UNKNOWN:
+        if rounding == UNKNOWN and ctx is not text:
             rounding = classify_rounding_policy(text)  # fallback to full doc
 
     ratio_new, ratio_old = extract_ratio(ctx)
     # Context slicing can miss the definitive ratio in very large filings.
-    # If we failed to parse a ratio from ctx, retry on the full document.
-    if ratio_new is None or ratio_old is None:
+    # If we failed to parse a ratio from ctx, retry on the full document
+    # (unless ctx already was the full document).
+    if (ratio_new is None or ratio_old is None) and ctx is not text:
         r2_new, r2_old = extract_ratio(text)
         if r2_new is not None and r2_old is not None:
             ratio_new, ratio_old = r2_new, r2_old
@@ -1374,4 +1463,102 @@ def extract_details(text: str, filed_at: datetime) -> Extraction:
         effective_date=effective,
         rounding_policy=rounding,
         matches_rounding=rounding != UNKNOWN,
-    )
\ No newline at end of file
+    )
+
+# classify() outcomes, in the order the runner rejects on them
+DELISTING_ONLY = "DELISTING_ONLY"
+NO_REVERSE = "NO_REVERSE"
+CANDIDATE = "CANDIDATE"
+
+
+def classify(text: str) -> str:
+    """
+    Fused is_delisting_notice_only + contains_reverse_split_language.
+
+    Both gates want the same lowercased, whitespace-collapsed copy of the
+    filing, so it is built once here instead of once per gate. Decisions and
+    precedence match calling the two public functions in turn.
+    """
+    if not text:
+        return NO_REVERSE
+
+    tl = text.lower()
+    maybe_reverse = "split" in tl or "consolidation" in tl
+    maybe_delisting = any(h in tl for h in _DELISTING_HINTS)
+    if not (maybe_reverse or maybe_delisting):
+        return NO_REVERSE  # most filings: no normalized copy needed at all
+
+    t = " ".join(tl.split())
+    del tl
+
+    if maybe_delisting and _is_delisting_notice_only_norm(t):
+        return DELISTING_ONLY
+    if maybe_reverse and _contains_reverse_split_language_norm(t):
+        return CANDIDATE
+    return NO_REVERSE
+
+
+@dataclass
+class FilingScreen:
+    """Text-derived facts the runner gates on, computed in one place."""
+    delisting_only: bool
+    has_reverse: bool
+    event_dt: Optional[datetime] = None
+    extraction: Optional[Extraction] = None
+    ticker: Optional[str] = None
+    exchange: Optional[str] = None
+
+
+def screen_filing(
+    text: Optional[str],
+    filed_at: datetime,
+    event_cutoff: Optional[datetime] = None,
+    today: Optional[date] = None,
+) -> Optional[FilingScreen]:
+    """
+    Run the CPU-heavy parse stages for one filing, stopping at the first gate
+    the runner would reject on. Returns None when there is no text.
+
+    The ticker scan is the last stage: it is skipped when the effective date is
+    missing or before today, or the policy is ROUND_DOWN.
+
+    Pure function of its arguments (module-level compiled regexes only), so it
+    can be mapped over a process pool.
+    """
+    if not text:
+        return None
+
+    verdict = classify(text)
+    if verdict != CANDIDATE:
+        return FilingScreen(delisting_only=verdict == DELISTING_ONLY, has_reverse=False)
+    return screen_candidate(text, filed_at, event_cutoff, today)
+
+
+def screen_candidate(
+    text: str,
+    filed_at: datetime,
+    event_cutoff: Optional[datetime] = None,
+    today: Optional[date] = None,
+) -> FilingScreen:
+    """
+    The stages of screen_filing after classify() has returned CANDIDATE, so a
+    caller that already classified the text can hand off only the survivors.
+    """
+    screen = FilingScreen(
+        delisting_only=False,
+        has_reverse=True,
+        event_dt=extract_event_reported_datetime(text),
+    )
+    if screen.event_dt is None:
+        return screen
+    if event_cutoff is not None and screen.event_dt < event_cutoff:
+        return screen  # stale; the runner rejects on event_dt alone
+
+    extraction = screen.extraction = extract_details(text, filed_at=filed_at)
+    if extraction.effective_date is None or extraction.rounding_policy == ROUND_DOWN:
+        return screen
+    if today is not None and extraction.effective_date.date() < today:
+        return screen
+
+    screen.ticker, screen.exchange = extract_common_ticker_exchange(text)
+    return screen
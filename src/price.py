@@ -1,32 +1,65 @@
 import csv
 import json
-from datetime import date
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 
 import requests
 
+from .jsonio import dumps as _json_dumps, loads as _json_loads, write_atomic as _write_atomic
+
 # yfinance remains available for callers that still rely on it, but new
 # functionality below uses the lighter-weight Stooq endpoint.
 import yfinance as yf
 
 
 class PriceCache:
-    def __init__(self, path: Path):
+    """
+    Day-level close cache persisted across runs.
+
+    Lookups are always for today's date, so entries older than ``max_age_days``
+    are expired on save to keep the file from growing without bound.
+    """
+
+    def __init__(self, path: Path, max_age_days: int = 7):
         self.path = path
+        self.max_age_days = max_age_days
         self._data: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
         if self.path.exists():
             try:
-                self._data = json.loads(self.path.read_text())
+                self._data = _json_loads(self.path.read_bytes())
             except json.JSONDecodeError:
                 self._data = {}
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._data, indent=2))
+        """Write once, atomically, and only if something was added or expired."""
+        with self._lock:
+            self._expire()
+            if not self._dirty:
+                return
+            payload = _json_dumps(self._data)
+            self._dirty = False
+        _write_atomic(self.path, payload)
+
+    def _expire(self) -> None:
+        cutoff = (date.today() - timedelta(days=self.max_age_days)).isoformat()
+        for ticker in list(self._data):
+            fresh = {d: px for d, px in self._data[ticker].items() if d >= cutoff}
+            if len(fresh) == len(self._data[ticker]):
+                continue
+            self._dirty = True
+            if fresh:
+                self._data[ticker] = fresh
+            else:
+                del self._data[ticker]
 
     def get(self, ticker: str, as_of: date) -> Optional[float]:
         record = self._data.get(ticker.upper(), {})
@@ -34,7 +67,9 @@ class PriceCache:
 
     def set(self, ticker: str, as_of: date, price: float) -> None:
         ticker_key = ticker.upper()
-        self._data.setdefault(ticker_key, {})[as_of.isoformat()] = price
+        with self._lock:
+            self._data.setdefault(ticker_key, {})[as_of.isoformat()] = price
+            self._dirty = True
 
 
 def fetch_stooq_close(ticker: str, cache: PriceCache, session: Optional[requests.Session] = None) -> Optional[float]:
@@ -82,18 +117,31 @@ def fetch_stooq_close(ticker: str, cache: PriceCache, session: Optional[requests
     return close
 
 
+@lru_cache(maxsize=256)
+def _last_close(symbol: str) -> Optional[float]:
+    """
+    Last Yahoo Finance close for a symbol, memoized per process.
+
+    Only the float is cached (not the yf.Ticker object), and misses are cached
+    too so a symbol Yahoo doesn't know isn't retried for every record.
+    """
+    try:
+        data = yf.Ticker(symbol).history(period="5d")
+    except Exception:
+        return None
+    if data.empty:
+        return None
+    return float(data["Close"].iloc[-1])
+
+
 def fetch_close_price(ticker: str, cache: PriceCache) -> Optional[float]:
     today = date.today()
     cached = cache.get(ticker, today)
     if cached is not None:
         return cached
-    try:
-        data = yf.Ticker(ticker).history(period="5d")
-    except Exception:
-        return None
-    if data.empty:
+    last_close = _last_close(ticker)
+    if last_close is None:
         return None
-    last_close = float(data["Close"].iloc[-1])
     cache.set(ticker, today, last_close)
     return last_close
 
@@ -108,3 +156,65 @@ def fetch_price_with_fallback(
         return stooq_px
 
     return fetch_close_price(ticker, cache)
+
+
+def _download_closes(symbols: List[str]) -> Dict[str, Optional[float]]:
+    """
+    Last Yahoo Finance close for several symbols in one batched request.
+
+    A single symbol goes through ``_last_close`` (yf.download returns a flat
+    frame in that case, and the memo is reusable). Symbols with no data map
+    to None.
+    """
+    if len(symbols) == 1:
+        return {symbols[0]: _last_close(symbols[0])}
+
+    try:
+        data = yf.download(
+            tickers=symbols, period="5d", group_by="ticker", threads=True, progress=False
+        )
+    except Exception:
+        return {sym: None for sym in symbols}
+
+    closes: Dict[str, Optional[float]] = {}
+    for sym in symbols:
+        try:
+            series = data[sym]["Close"].dropna()
+        except (KeyError, TypeError):
+            closes[sym] = None
+            continue
+        closes[sym] = float(series.iloc[-1]) if not series.empty else None
+    return closes
+
+
+def fetch_prices_with_fallback(
+    tickers: Iterable[str],
+    cache: PriceCache,
+    session: Optional[requests.Session] = None,
+    max_workers: int = 8,
+) -> Dict[str, Optional[float]]:
+    """
+    Batch form of fetch_price_with_fallback.
+
+    Each unique ticker is tried against the cache/Stooq first (concurrently,
+    up to ``max_workers`` at a time); whatever is still missing is fetched
+    from Yahoo Finance in a single yf.download call instead of one history()
+    request per ticker.
+    """
+    today = date.today()
+    unique = list(dict.fromkeys(t for t in tickers if t))
+    if not unique:
+        return {}
+
+    # Stooq lookups are independent round-trips; overlap them.
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as ex:
+        closes = ex.map(lambda t: fetch_stooq_close(t, cache, session=session), unique)
+        prices: Dict[str, Optional[float]] = dict(zip(unique, closes))
+
+    missing = [t for t, px in prices.items() if px is None]
+    if missing:
+        for ticker, px in _download_closes(missing).items():
+            prices[ticker] = px
+            if px is not None:
+                cache.set(ticker, today, px)
+    return prices
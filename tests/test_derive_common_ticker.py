@@ -0,0 +1,24 @@
+import unittest
+
+from run import derive_common_ticker_from_map
+
+
+class DeriveCommonTickerTest(unittest.TestCase):
+    def test_common_tickers_with_suffix_lookalikes_are_not_derived(self):
+        # VRT/CART/FLWS are common stock; V, CA and FL belong to other issuers
+        for ticker in ("VRT", "CART", "FLWS"):
+            with self.subTest(ticker=ticker):
+                self.assertIsNone(derive_common_ticker_from_map(ticker))
+                self.assertIsNone(derive_common_ticker_from_map(ticker, [ticker]))
+
+    def test_trailing_w_is_dropped(self):
+        self.assertEqual(derive_common_ticker_from_map("BENFW"), "BENF")
+
+    def test_long_suffix_needs_confirmation(self):
+        self.assertIsNone(derive_common_ticker_from_map("ABCWS"))
+        self.assertEqual(derive_common_ticker_from_map("ABCWS", ["ABC", "ABCWS"]), "ABC")
+        self.assertEqual(derive_common_ticker_from_map("ABCRT", ["abc"]), "ABC")
+
+
+if __name__ == "__main__":
+    unittest.main()
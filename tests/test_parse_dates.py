@@ -0,0 +1,22 @@
+import unittest
+
+from src import parse
+
+
+class GluedDateTest(unittest.TestCase):
+    """Flattened HTML can glue a date onto the preceding word ("EffectiveSeptember 5, 2026")."""
+
+    GLUED = "Market EffectiveSeptember 5, 2026 at 12:01 a.m."
+
+    def test_month_date_patterns_match_glued_dates(self):
+        for rx in (parse.MONTH_DATE_ANYWHERE, parse.DATE_ANY):
+            with self.subTest(pattern=rx.pattern):
+                self.assertEqual(rx.search(self.GLUED).group("date"), "September 5, 2026")
+
+    def test_first_date_in_prefers_glued_month_date(self):
+        m = parse._first_date_in("as of 9/1/2026, EffectiveSeptember 5, 2026")
+        self.assertEqual(m.group("mdy"), "September 5, 2026")
+
+
+if __name__ == "__main__":
+    unittest.main()